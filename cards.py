@@ -1,9 +1,18 @@
 """Card representations and deck management for Blackjack."""
 
 import random
-from typing import List
+from typing import Dict, List, Tuple
 from enum import Enum
 
+# Dedicated generator for shuffling, so games can be seeded reproducibly
+# without touching the global random module
+_RNG = random.Random()
+
+
+def set_seed(seed) -> None:
+    """Seed the shuffle generator (for tests and reproducible runs)."""
+    _RNG.seed(seed)
+
 
 class Suit(Enum):
     """Card suits (Unicode symbols)."""
@@ -43,19 +52,37 @@ class Rank(Enum):
 class Card:
     """Single playing card with suit and rank."""
 
+    __slots__ = ("suit", "rank", "value", "is_ace", "_str")
+
+    # One shared instance per (suit, rank); see Card.get()
+    _POOL: Dict[Tuple[Suit, Rank], "Card"] = {}
+
     def __init__(self, suit: Suit, rank: Rank):
         self.suit = suit
         self.rank = rank
+        # Cached as plain int/bool so hand totals skip the Enum lookups
+        self.value = rank.base_value
+        self.is_ace = rank is Rank.ACE
+        # Cards never change, so the display string is built once
+        self._str = f"{rank.display}{suit.value}"
+
+    @classmethod
+    def get(cls, suit: Suit, rank: Rank) -> "Card":
+        """Return the shared Card for suit and rank, creating it on first use."""
+        card = cls._POOL.get((suit, rank))
+        if card is None:
+            card = cls._POOL[(suit, rank)] = cls(suit, rank)
+        return card
 
     def __str__(self) -> str:
         """Returns card string (e.g., 'A♥', '10♦')."""
-        return f"{self.rank.display}{self.suit.value}"
+        return self._str
 
     def get_value(self, allow_ace_as_one: bool = False) -> int:
         """Return card value. Aces default to 11, or 1 if allow_ace_as_one=True."""
-        if self.rank == Rank.ACE and allow_ace_as_one:
+        if self.is_ace and allow_ace_as_one:
             return 1
-        return self.rank.base_value
+        return self.value
     def image_key(self) -> str:
         '''returns the image key so that it can pull the assigned png 
         examples AH, AS ect.'''
@@ -66,33 +93,50 @@ class Card:
         return f"{rank}{suit_short}"
 
 
+# Full 52-card deck (4 suits × 13 ranks), built once at import time.
+# Cards are immutable, so every Deck can share these instances.
+_DECK_TEMPLATE: List[Card] = [Card.get(suit, rank) for suit in Suit for rank in Rank]
+
 
 class Deck:
     """Standard 52-card deck with shuffle and deal operations."""
 
+    __slots__ = ("cards", "_top")
+
     def __init__(self):
         self.cards: List[Card] = []
+        # Index of the next card to deal; cards before it are already dealt
+        self._top = 0
         self._build()
 
     def _build(self):
         """Build complete 52-card deck (4 suits × 13 ranks)."""
-        for suit in Suit:
-            for rank in Rank:
-                self.cards.append(Card(suit, rank))
+        self.cards = _DECK_TEMPLATE.copy()
 
     def shuffle(self):
-        """Randomize card order."""
-        random.shuffle(self.cards)
+        """Randomize card order and return all 52 cards to the deck.
+
+        Fisher-Yates shuffle that scales one random float per swap
+        (multiply instead of random.shuffle's bit-draw and retry loop).
+        """
+        self._top = 0
+        cards = self.cards
+        rand = _RNG.random
+        for i in range(len(cards) - 1, 0, -1):
+            j = int(rand() * (i + 1))
+            cards[i], cards[j] = cards[j], cards[i]
 
     def deal(self) -> Card:
         """Deal a card from the top of the deck.
         
         Raises ValueError if deck is empty (reshuffle handled in game.py).
         """
-        if not self.cards:
+        top = self._top
+        if top >= len(self.cards):
             raise ValueError("Deck is empty")
-        return self.cards.pop()
+        self._top = top + 1
+        return self.cards[top]
 
     def remaining(self) -> int:
         """Return number of cards left in deck."""
-        return len(self.cards)
+        return len(self.cards) - self._top
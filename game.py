@@ -1,13 +1,21 @@
 """Blackjack game state machine and logic."""
 
-from typing import Tuple, List
-from cards import Deck
-from hand_logic import calculate_hand_value, compare_hands
+import random
+from typing import Optional, Tuple, List
+from cards import Card, Deck, Rank, Suit
+from hand_logic import calculate_hand_value, add_card_value, compare_hands_result, format_result_message
 
 
 class BlackjackGame:
     """Main game state machine."""
 
+    __slots__ = (
+        "starting_balance", "target_balance", "mode", "balance", "current_bet",
+        "deck", "player_hand", "dealer_hand", "game_state", "result_message",
+        "_p_total", "_p_aces", "_d_total", "_d_aces",
+        "_p_version", "_d_version", "_p_str_cache", "_d_str_cache",
+    )
+
     def __init__(self, starting_balance: int = 2000, target_balance: int = 25000, mode: str = "classic"):
         """Initialize the game."""
         self.starting_balance = starting_balance
@@ -24,15 +32,36 @@ class BlackjackGame:
         self.player_hand: List = []
         self.dealer_hand: List = []
 
+        # Running totals and soft-Ace counts, kept in step with the hands
+        # so decisions don't need to re-scan every card
+        self._p_total = self._p_aces = self._d_total = self._d_aces = 0
+
+        # Hand versions bump whenever a hand changes; the display strings
+        # are cached against them since the window redraws every frame
+        self._p_version = self._d_version = 0
+        self._p_str_cache: Tuple[int, str] = (-1, "")
+        self._d_str_cache: Tuple[int, bool, str] = (-1, False, "")
+
         # Game state: one of betting, dealing, playing, result, won, lost, out_of_money
         # DON'T modify these strings without updating all references in window.py
         self.game_state = "betting"
         self.result_message = ""
 
+    def _deal_to(self, hand: List, total_attr: str, aces_attr: str):
+        """Deal one card into hand and update its running total."""
+        card = self.deck.deal()
+        hand.append(card)
+        total, aces = add_card_value(getattr(self, total_attr), getattr(self, aces_attr), card)
+        setattr(self, total_attr, total)
+        setattr(self, aces_attr, aces)
+
     def reset_for_new_hand(self):
         """Reset hands and state for a new round."""
         self.player_hand.clear()
         self.dealer_hand.clear()
+        self._p_total = self._p_aces = self._d_total = self._d_aces = 0
+        self._p_version += 1
+        self._d_version += 1
         self.game_state = "betting"
         self.result_message = ""
         self.current_bet = 0
@@ -40,7 +69,6 @@ class BlackjackGame:
         # Reshuffle if deck is getting low (less than 10 cards)
         # This prevents card shortage during play
         if self.deck.remaining() < 10:
-            self.deck = Deck()
             self.deck.shuffle()
 
     def place_bet(self, amount: int = 0) -> Tuple[bool, str]:
@@ -94,13 +122,20 @@ class BlackjackGame:
         - If 3:2 payout calculation changes, house goes broke
         - If state transitions change, dealer won't get their turn
         """
-        # Deal 2 cards to each
-        self.player_hand = [self.deck.deal(), self.deck.deal()]
-        self.dealer_hand = [self.deck.deal(), self.deck.deal()]
-        
-        # Calculate initial totals
-        player_total, _ = calculate_hand_value(self.player_hand)
-        dealer_total, _ = calculate_hand_value(self.dealer_hand)
+        # Deal 2 cards to each (attribute lookups hoisted into locals)
+        deal = self.deck.deal
+        self.player_hand[:] = player_cards = [deal(), deal()]
+        self.dealer_hand[:] = dealer_cards = [deal(), deal()]
+        self._p_version += 1
+        self._d_version += 1
+
+        # Initial totals are tracked as the cards are dealt
+        player_total, player_aces = add_card_value(0, 0, player_cards[0])
+        player_total, player_aces = add_card_value(player_total, player_aces, player_cards[1])
+        dealer_total, dealer_aces = add_card_value(0, 0, dealer_cards[0])
+        dealer_total, dealer_aces = add_card_value(dealer_total, dealer_aces, dealer_cards[1])
+        self._p_total, self._p_aces = player_total, player_aces
+        self._d_total, self._d_aces = dealer_total, dealer_aces
         
         # Check for natural blackjack (21 on first two cards)
         if player_total == 21 and dealer_total != 21:
@@ -156,8 +191,9 @@ class BlackjackGame:
             return "invalid", "Cannot hit now."
 
         # Draw a card
-        self.player_hand.append(self.deck.deal())
-        player_total, _ = calculate_hand_value(self.player_hand)
+        self._deal_to(self.player_hand, "_p_total", "_p_aces")
+        self._p_version += 1
+        player_total = self._p_total
 
         # Check if player busted
         if player_total > 21:
@@ -178,7 +214,7 @@ class BlackjackGame:
         - Note: This game uses "soft 17 stand" (dealer stands on soft 17)
         
         After dealer finishes:
-        - Compare hands using compare_hands()
+        - Compare hands using compare_hands_result()
         - Update balance based on outcome
         - Check for win condition (balance >= target_balance)
         - Check for loss condition (balance <= 0)
@@ -200,23 +236,30 @@ class BlackjackGame:
         - If dealer >= 17 changes to > 17, soft 17s won't stand
         - If win condition balance calculation is wrong, game doesn't track money
         - If out_of_money check is removed, player can continue with -$ balance
-        - If compare_hands() result string changes, balance updates fail
+        - If compare_hands_result() result string changes, balance updates fail
         """
         # Can only stand during active play
         if self.game_state != "playing":
             return "invalid", "Cannot stand now."
 
         # Dealer plays: hits on 16 or less, stands on 17+
-        while True:
-            dealer_total, _ = calculate_hand_value(self.dealer_hand)
-            if dealer_total >= 17:
-                break
-            self.dealer_hand.append(self.deck.deal())
+        # Dealer total is kept up to date per card, so each check is a plain
+        # int compare; attribute lookups are hoisted into locals for the loop
+        deal = self.deck.deal
+        append = self.dealer_hand.append
+        add = add_card_value
+        dealer_total, dealer_aces = self._d_total, self._d_aces
+        while dealer_total < 17:
+            card = deal()
+            append(card)
+            dealer_total, dealer_aces = add(dealer_total, dealer_aces, card)
+        self._d_total, self._d_aces = dealer_total, dealer_aces
+        self._d_version += 1
 
         # Compare final hands
-        player_total, _ = calculate_hand_value(self.player_hand)
-        dealer_total, _ = calculate_hand_value(self.dealer_hand)
-        result, message = compare_hands(player_total, dealer_total)
+        player_total = self._p_total
+        dealer_total = self._d_total
+        result = compare_hands_result(player_total, dealer_total)
 
         # Update balance based on result
         if result == "win":
@@ -226,6 +269,7 @@ class BlackjackGame:
         # "push" and "bust" don't change balance (already handled in hit())
 
         self.game_state = "result"
+        message = format_result_message(result, player_total, dealer_total)
         self.result_message = message
 
         # Check for overall game win/loss conditions
@@ -249,10 +293,17 @@ class BlackjackGame:
         Returns:
             Formatted string with all cards and total value
         """
+        # Reuse the last string if the hand hasn't changed since
+        version, cached = self._p_str_cache
+        if version == self._p_version:
+            return cached
+
         cards_str = ", ".join(str(card) for card in self.player_hand)
         total, has_ace = calculate_hand_value(self.player_hand)
         soft_str = " (soft)" if has_ace else ""
-        return f"Player: {cards_str} = {total}{soft_str}"
+        hand_str = f"Player: {cards_str} = {total}{soft_str}"
+        self._p_str_cache = (self._p_version, hand_str)
+        return hand_str
 
     def get_dealer_hand_str(self, hide_hole_card: bool = False) -> str:
         """Return dealer's hand as a formatted string for display.
@@ -269,16 +320,23 @@ class BlackjackGame:
             - Playing state: "Dealer: K♠, [hidden]"
             - Result state: "Dealer: K♠, 7♥ = 17"
         """
+        # Reuse the last string if the hand and hole-card setting are unchanged
+        version, hidden, cached = self._d_str_cache
+        if version == self._d_version and hidden == hide_hole_card:
+            return cached
+
         if hide_hole_card and len(self.dealer_hand) >= 2:
             # Only show first card (hole card is hidden)
             cards_str = f"{self.dealer_hand[0]}, [hidden]"
-            return f"Dealer: {cards_str}"
+            hand_str = f"Dealer: {cards_str}"
         else:
             # Show all cards with total
             cards_str = ", ".join(str(card) for card in self.dealer_hand)
             total, has_ace = calculate_hand_value(self.dealer_hand)
             soft_str = " (soft)" if has_ace else ""
-            return f"Dealer: {cards_str} = {total}{soft_str}"
+            hand_str = f"Dealer: {cards_str} = {total}{soft_str}"
+        self._d_str_cache = (self._d_version, hide_hole_card, hand_str)
+        return hand_str
 
     def reset_balance_on_broke(self):
         """Reset player balance and hands when broke (balance <= 0).
@@ -301,6 +359,9 @@ class BlackjackGame:
         # Reset hands and prepare for new betting phase
         self.player_hand.clear()
         self.dealer_hand.clear()
+        self._p_total = self._p_aces = self._d_total = self._d_aces = 0
+        self._p_version += 1
+        self._d_version += 1
         self.current_bet = 0
         self.result_message = ""
         
@@ -310,5 +371,50 @@ class BlackjackGame:
         
         # Reshuffle if deck is getting low
         if self.deck.remaining() < 10:
-            self.deck = Deck()
+            self.deck.shuffle()
+
+    @classmethod
+    def simulate(cls, num_hands: int, seed: Optional[int] = None) -> Tuple[int, int, int]:
+        """Play num_hands hands automatically and tally the outcomes.
+
+        Meant for strategy checks and stress runs rather than the UI, so it
+        skips the game state machine entirely:
+        - Cards are drawn with replacement (an endless shoe), so no deck
+          bookkeeping or reshuffles are needed
+        - Player follows the dealer's rule: hit on 16 or less, stand on 17+
+        - Dealer only plays if the player hasn't busted
+        - Natural blackjacks are scored like any other 21 (no 3:2 payout)
+
+        Args:
+            num_hands: Number of hands to play
+            seed: Optional seed so runs can be reproduced
+
+        Returns:
+            Tuple of (wins, losses, pushes); player busts count as losses
+        """
+        rand = random.Random(seed).random
+        cards = [Card.get(suit, rank) for suit in Suit for rank in Rank]
+        num_cards = len(cards)
+        wins = losses = pushes = 0
+
+        for _ in range(num_hands):
+            p_total = p_aces = d_total = d_aces = 0
+            for _ in range(2):
+                p_total, p_aces = add_card_value(p_total, p_aces, cards[int(rand() * num_cards)])
+                d_total, d_aces = add_card_value(d_total, d_aces, cards[int(rand() * num_cards)])
+
+            while p_total < 17:
+                p_total, p_aces = add_card_value(p_total, p_aces, cards[int(rand() * num_cards)])
+            if p_total <= 21:
+                while d_total < 17:
+                    d_total, d_aces = add_card_value(d_total, d_aces, cards[int(rand() * num_cards)])
+
+            result = compare_hands_result(p_total, d_total)
+            if result == "win":
+                wins += 1
+            elif result == "push":
+                pushes += 1
+            else:
+                losses += 1
 
+        return wins, losses, pushes
@@ -1,7 +1,23 @@
 """Hand value calculation and outcome comparison for Blackjack."""
 
 from typing import Tuple, List
-from cards import Card, Rank
+from cards import Card
+
+
+def _settle_aces(total: int, soft_aces: int) -> Tuple[int, int]:
+    """Convert just enough Aces from 11 to 1 to bring total to <= 21.
+
+    Works on plain ints only (no Card objects), so it is shared by the
+    full-hand and incremental calculations below.
+
+    Returns:
+        Tuple of (total, soft_aces) after conversion
+    """
+    if total <= 21:
+        return total, soft_aces
+    # ceil((total - 21) / 10) Aces are needed, capped at the number of Aces
+    demote = min(soft_aces, (total - 21 + 9) // 10)
+    return total - 10 * demote, soft_aces - demote
 
 
 def calculate_hand_value(cards: List[Card]) -> Tuple[int, bool]:
@@ -15,19 +31,69 @@ def calculate_hand_value(cards: List[Card]) -> Tuple[int, bool]:
     Returns:
         Tuple of (total_value, hand_has_usable_ace)
     """
-    total = sum(card.get_value(allow_ace_as_one=False) for card in cards)
-    num_aces = sum(1 for card in cards if card.rank == Rank.ACE)
+    # Single pass over the hand using the values cached on each Card
+    total = 0
+    num_aces = 0
+    for card in cards:
+        total += card.value
+        num_aces += card.is_ace
 
-    # Convert Aces from 11 to 1 until hand <= 21
-    while total > 21 and num_aces > 0:
-        total -= 10
-        num_aces -= 1
+    total, soft_aces = _settle_aces(total, num_aces)
 
     # Soft hand if an Ace remains as 11
-    has_ace = num_aces > 0
+    has_ace = soft_aces > 0
     return total, has_ace
 
 
+def add_card_value(total: int, soft_aces: int, card: Card) -> Tuple[int, int]:
+    """Add one card to a running hand total.
+
+    Lets the game keep hand totals up to date as cards are dealt instead
+    of re-walking the whole hand with calculate_hand_value().
+
+    Args:
+        total: Current hand total
+        soft_aces: Number of Aces in the hand still counted as 11
+        card: Card being added to the hand
+
+    Returns:
+        Tuple of (new_total, new_soft_aces)
+    """
+    return _settle_aces(total + card.value, soft_aces + card.is_ace)
+
+
+# Outcome when neither hand busts, indexed by sign(player - dealer) + 1
+_SHOWDOWN_RESULTS = ("lose", "push", "win")
+
+
+def compare_hands_result(player_total: int, dealer_total: int) -> str:
+    """Compare player and dealer totals without building a message.
+
+    Returns:
+        "bust", "win", "lose", or "push"
+    """
+    if player_total > 21:
+        return "bust"
+    if dealer_total > 21:
+        return "win"
+    # Neither busted: index by the sign of (player - dealer)
+    return _SHOWDOWN_RESULTS[(player_total > dealer_total) - (player_total < dealer_total) + 1]
+
+
+def format_result_message(result: str, player_total: int, dealer_total: int) -> str:
+    """Return the human-readable message for a compare_hands_result() outcome."""
+    if result == "bust":
+        return "Bust! Dealer wins."
+    elif result == "win":
+        if dealer_total > 21:
+            return "Dealer busts! You win."
+        return "You win!"
+    elif result == "push":
+        return "Push! It's a tie."
+    else:
+        return "Dealer wins."
+
+
 def compare_hands(player_total: int, dealer_total: int) -> Tuple[str, str]:
     """Compare player and dealer hands to determine outcome.
     
@@ -36,13 +102,5 @@ def compare_hands(player_total: int, dealer_total: int) -> Tuple[str, str]:
         - result_string: "bust", "win", "lose", or "push"
         - message_string: Human-readable outcome
     """
-    if player_total > 21:
-        return "bust", "Bust! Dealer wins."
-    elif dealer_total > 21:
-        return "win", "Dealer busts! You win."
-    elif player_total == dealer_total:
-        return "push", "Push! It's a tie."
-    elif player_total > dealer_total:
-        return "win", "You win!"
-    else:
-        return "lose", "Dealer wins."
+    result = compare_hands_result(player_total, dealer_total)
+    return result, format_result_message(result, player_total, dealer_total)
@@ -32,7 +32,6 @@ Dependencies:
 """
 
 import os
-import cards
 import pygame
 import sys
 from game import BlackjackGame